@@ -0,0 +1,71 @@
+"""Render the user manual from Markdown to HTML.
+
+Writes two files from `src/dss/pages/user_manual.md`:
+
+* `src/dss/pages/user_manual.html` – the HTML fragment rendered inside the
+  User Manual page when static file serving is disabled.
+* `src/static/user_manual.html` – a standalone document served by
+  Streamlit's static file server and shown in an iframe, plus a gzip
+  compressed copy `user_manual.html.gz` for reverse proxies that serve
+  precompressed files (e.g. nginx ``gzip_static on;``).
+
+Run it from the repository root after editing the Markdown::
+
+    python scripts/build_manual.py
+"""
+
+from pathlib import Path
+import gzip
+import markdown
+
+ROOT = Path(__file__).resolve().parents[1]
+SOURCE = ROOT / "src" / "dss" / "pages" / "user_manual.md"
+FRAGMENT = ROOT / "src" / "dss" / "pages" / "user_manual.html"
+DOCUMENT = ROOT / "src" / "static" / "user_manual.html"
+COMPRESSED = DOCUMENT.with_name(DOCUMENT.name + ".gz")
+
+DOCUMENT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>User Manual</title>
+<style>
+body {{ font-family: "Source Sans Pro", sans-serif; line-height: 1.6; max-width: 60rem; margin: 0 auto; padding: 0 1rem; color: #31333f; }}
+code {{ background: #f0f2f6; padding: 0.1em 0.3em; border-radius: 0.25rem; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def render_fragment(source: str) -> str:
+    """Convert the manual Markdown to an HTML fragment."""
+    return markdown.markdown(source, extensions=["extra", "sane_lists"]) + "\n"
+
+
+def render_document(fragment: str) -> str:
+    """Wrap an HTML fragment in the standalone manual document."""
+    return DOCUMENT_TEMPLATE.format(body=fragment.rstrip("\n"))
+
+
+def compress(document: str) -> bytes:
+    """Gzip the document; ``mtime=0`` keeps the output reproducible."""
+    return gzip.compress(document.encode("utf-8"), compresslevel=9, mtime=0)
+
+
+def main() -> None:
+    fragment = render_fragment(SOURCE.read_text(encoding="utf-8"))
+    FRAGMENT.write_text(fragment, encoding="utf-8")
+    DOCUMENT.parent.mkdir(parents=True, exist_ok=True)
+    document = render_document(fragment)
+    DOCUMENT.write_text(document, encoding="utf-8")
+    COMPRESSED.write_bytes(compress(document))
+    for path in (FRAGMENT, DOCUMENT, COMPRESSED):
+        print(f"Wrote {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,17 @@
 This module computes a variety of centrality measures using NetworkX
 functions and provides helper functions to combine them.  Degree,
 Katz, eigenvector, betweenness, closeness and PageRank centralities are
-supported.  Additional measures can be added easily by extending
-`compute_centralities`.
+supported.  Additional measures can be added easily by registering them
+in `CENTRALITY_MEASURES`.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional
 import numpy as np
 import pandas as pd
 import networkx as nx
 
 from ..types import CentralityResult
+from ..config import DEFAULTS
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -50,47 +51,79 @@ def _safe_katz_centrality(G: nx.Graph, alpha: Optional[float] = None, beta: floa
         return {n: 0.0 for n in G.nodes()}
 
 
-def compute_centralities(G: nx.Graph) -> pd.DataFrame:
+def _safe_eigenvector_centrality(G: nx.Graph) -> Dict[Any, float]:
+    """Compute eigenvector centrality, falling back to zeros on failure."""
+    try:
+        return nx.eigenvector_centrality_numpy(G)
+    except Exception as e:
+        logger.warning(f"Eigenvector centrality failed: {e}")
+        return {n: 0.0 for n in G.nodes()}
+
+
+def _sampled_betweenness_centrality(G: nx.Graph) -> Dict[Any, float]:
+    """Compute betweenness centrality, sampling sources on large graphs.
+
+    Exact betweenness needs a shortest-path search from every node.  Graphs
+    with more than `DEFAULTS.betweenness_samples` nodes use that many
+    randomly chosen sources instead (seeded by `DEFAULTS.seed`), which
+    approximates the ranking at a fraction of the cost.
+    """
+    n = G.number_of_nodes()
+    k = DEFAULTS.betweenness_samples if n > DEFAULTS.betweenness_samples else None
+    return nx.betweenness_centrality(G, k=k, normalized=True, seed=DEFAULTS.seed)
+
+
+# Centrality measures by column name.  Each function maps a graph to a
+# node -> score dictionary and is only called when its column is needed.
+CENTRALITY_MEASURES: Dict[str, Callable[[nx.Graph], Dict[Any, float]]] = {
+    "degree": lambda G: dict(G.degree()),
+    # Katz centrality with auto‑chosen alpha
+    "katz": _safe_katz_centrality,
+    "eigenvector": _safe_eigenvector_centrality,
+    "betweenness": _sampled_betweenness_centrality,
+    "closeness": nx.closeness_centrality,
+    # PageRank (as an additional robustness check)
+    "pagerank": nx.pagerank,
+}
+
+
+def compute_centrality(G: nx.Graph, name: str) -> pd.Series:
+    """Compute a single centrality measure from `CENTRALITY_MEASURES`.
+
+    Parameters
+    ----------
+    G: networkx.Graph
+        The graph for which to compute the centrality.
+    name: str
+        Column name of the measure, e.g. "betweenness".
+
+    Returns
+    -------
+    pandas.Series
+        Scores indexed by node.
+    """
+    return pd.Series(CENTRALITY_MEASURES[name](G), name=name)
+
+
+def compute_centralities(G: nx.Graph, measures: Optional[Iterable[str]] = None) -> pd.DataFrame:
     """Compute multiple centrality measures for the graph.
 
     Parameters
     ----------
     G: networkx.Graph
         The graph for which to compute centralities.
+    measures: iterable of str, optional
+        Names of the measures to compute.  Defaults to all measures in
+        `CENTRALITY_MEASURES`.
 
     Returns
     -------
     pandas.DataFrame
         A table indexed by node with one column per centrality measure.
     """
-    # Degree centrality
-    deg = nx.degree_centrality(G)
-    # Katz centrality with auto‑chosen alpha
-    katz = _safe_katz_centrality(G)
-    # Eigenvector centrality
-    try:
-        eigen = nx.eigenvector_centrality_numpy(G)
-    except Exception as e:
-        logger.warning(f"Eigenvector centrality failed: {e}")
-        eigen = {n: 0.0 for n in G.nodes()}
-    # Betweenness centrality
-    between = nx.betweenness_centrality(G, normalized=True)
-    # Closeness centrality
-    closeness = nx.closeness_centrality(G)
-    # PageRank (as an additional robustness check)
-    pagerank = nx.pagerank(G)
-    # Construct DataFrame
-    df = pd.DataFrame(
-        {
-            "degree": pd.Series(dict(G.degree())),
-            # "degree": pd.Series(deg),
-            "katz": pd.Series(katz),
-            "eigenvector": pd.Series(eigen),
-            "betweenness": pd.Series(between),
-            "closeness": pd.Series(closeness),
-            "pagerank": pd.Series(pagerank),
-        }
-    )
+    if measures is None:
+        measures = CENTRALITY_MEASURES.keys()
+    df = pd.DataFrame({name: compute_centrality(G, name) for name in measures})
     return df
 
 
@@ -35,6 +35,14 @@ class Defaults:
     # layout_spacing: float = 2.5
     layout_spacing: float = 2.7
 
+    # Node count above which the Kamada–Kawai layout (dense n x n distance
+    # matrix) is replaced by the spring layout; a few seconds at 500 nodes
+    layout_size_threshold: int = 500
+
+    # Number of source nodes sampled for betweenness centrality on graphs
+    # larger than this (smaller graphs use the exact computation)
+    betweenness_samples: int = 500
+
     # Random seed for reproducibility
     seed: int = 55
 
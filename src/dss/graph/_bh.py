@@ -0,0 +1,145 @@
+"""Barnes–Hut approximation of the FR repulsive forces.
+
+The quadtree is stored in flat arrays so that Numba can build and walk
+it without Python objects: cell ``c`` has its four children at
+``children[4 * c: 4 * c + 4]`` (``-1`` for a leaf), the number of bodies
+below it in ``count``, the sum of their positions in ``sum_xy`` and its
+side length in ``width``.  ``body`` holds the node index stored in a
+leaf, ``-1`` for an empty or internal cell and ``-2`` for a leaf holding
+several nodes (coincident points or an exhausted cell budget).
+
+Like `_fr_kernel`, this module imports without Numba (see `_jit`) but is
+then slow.
+"""
+
+import numpy as np
+
+from ._jit import njit, prange
+
+# Opening criterion: a cell of width s at distance d is treated as a
+# single body when s / d < THETA.
+THETA = 0.9
+
+# Maximum subdivision depth; deeper cells collect their nodes in one leaf.
+MAX_DEPTH = 32
+
+
+@njit(fastmath=True, cache=True)
+def build_quadtree(pos):
+    """Build the quadtree of an ``(n, 2)`` position array.
+
+    Returns
+    -------
+    tuple
+        ``(children, body, count, sum_xy, centre, width, n_cells)`` as
+        described in the module docstring; only the first ``n_cells``
+        entries of each array are in use.
+    """
+    n = pos.shape[0]
+    cap = 16 * n + 64
+    children = np.full(4 * cap, -1, dtype=np.int32)
+    body = np.full(cap, -1, dtype=np.int32)
+    count = np.zeros(cap, dtype=np.int32)
+    sum_xy = np.zeros((cap, 2))
+    centre = np.zeros((cap, 2))
+    width = np.zeros(cap)
+
+    x_min = pos[:, 0].min()
+    x_max = pos[:, 0].max()
+    y_min = pos[:, 1].min()
+    y_max = pos[:, 1].max()
+    centre[0, 0] = 0.5 * (x_min + x_max)
+    centre[0, 1] = 0.5 * (y_min + y_max)
+    width[0] = max(x_max - x_min, y_max - y_min) * 1.0001 + 1e-9
+    n_cells = 1
+
+    for b in range(n):
+        x = pos[b, 0]
+        y = pos[b, 1]
+        cell = 0
+        depth = 0
+        while True:
+            count[cell] += 1
+            sum_xy[cell, 0] += x
+            sum_xy[cell, 1] += y
+            if children[4 * cell] >= 0:
+                # Internal cell: descend into the quadrant holding b.
+                q = (1 if x >= centre[cell, 0] else 0) + (2 if y >= centre[cell, 1] else 0)
+                cell = children[4 * cell + q]
+                depth += 1
+                continue
+            if count[cell] == 1:
+                body[cell] = b
+                break
+            if body[cell] < 0 or depth >= MAX_DEPTH or n_cells + 4 > cap:
+                body[cell] = -2
+                break
+            # Split the leaf and move its current body into a child.
+            half = 0.5 * width[cell]
+            for q in range(4):
+                child = n_cells + q
+                children[4 * cell + q] = child
+                width[child] = half
+                centre[child, 0] = centre[cell, 0] + (0.5 * half if q & 1 else -0.5 * half)
+                centre[child, 1] = centre[cell, 1] + (0.5 * half if q & 2 else -0.5 * half)
+            n_cells += 4
+            old = body[cell]
+            body[cell] = -1
+            q_old = (1 if pos[old, 0] >= centre[cell, 0] else 0) + (2 if pos[old, 1] >= centre[cell, 1] else 0)
+            child = children[4 * cell + q_old]
+            count[child] = 1
+            sum_xy[child, 0] = pos[old, 0]
+            sum_xy[child, 1] = pos[old, 1]
+            body[child] = old
+            q = (1 if x >= centre[cell, 0] else 0) + (2 if y >= centre[cell, 1] else 0)
+            cell = children[4 * cell + q]
+            depth += 1
+
+    return children, body, count, sum_xy, centre, width, n_cells
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def bh_repulsion(pos, k, theta, disp):
+    """Add the approximate FR repulsion ``k**2 / d`` to `disp` in place."""
+    n = pos.shape[0]
+    children, body, count, sum_xy, centre, width, _ = build_quadtree(pos)
+    k2 = k * k
+    theta2 = theta * theta
+    for i in prange(n):
+        xi = pos[i, 0]
+        yi = pos[i, 1]
+        fx = 0.0
+        fy = 0.0
+        stack = np.empty(4 * MAX_DEPTH + 4, dtype=np.int32)
+        stack[0] = 0
+        top = 1
+        while top > 0:
+            top -= 1
+            cell = stack[top]
+            m = count[cell]
+            if m == 0 or body[cell] == i:
+                continue
+            cx = sum_xy[cell, 0]
+            cy = sum_xy[cell, 1]
+            is_leaf = children[4 * cell] < 0
+            if is_leaf and body[cell] == -2:
+                # Multi-body leaf: exclude i itself if it lives here.
+                if abs(xi - centre[cell, 0]) <= 0.5 * width[cell] and abs(yi - centre[cell, 1]) <= 0.5 * width[cell]:
+                    cx -= xi
+                    cy -= yi
+                    m -= 1
+                    if m == 0:
+                        continue
+            dx = xi - cx / m
+            dy = yi - cy / m
+            d2 = max(dx * dx + dy * dy, 1e-4)
+            if is_leaf or width[cell] * width[cell] < theta2 * d2:
+                f = m * k2 / d2
+                fx += dx * f
+                fy += dy * f
+            else:
+                for q in range(4):
+                    stack[top] = children[4 * cell + q]
+                    top += 1
+        disp[i, 0] += fx
+        disp[i, 1] += fy
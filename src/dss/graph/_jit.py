@@ -0,0 +1,20 @@
+"""Optional Numba support for the layout kernels.
+
+Numba is an optional dependency.  When it is not installed
+`NUMBA_AVAILABLE` is False and `njit` / `prange` fall back to no-op
+stand-ins, so the kernels still import and run, just without compilation.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for `numba.njit` that leaves the function untouched."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -1,50 +1,580 @@
 """Compute and cache graph layouts."""
 
-from typing import Dict, Any
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, Tuple
+import hashlib
+import os
+import tempfile
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import minimize
+from scipy.sparse.csgraph import connected_components, shortest_path
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import pdist, squareform
 from ..utils.caching import cache_data
 from ..config import DEFAULTS
+from ..types import LayoutResult
+from ..logging_config import get_logger
+from ._fr_kernel import fr_layout
+from ._jit import NUMBA_AVAILABLE
+
+logger = get_logger(__name__)
+
+
+# Graphs with more nodes than this bypass NetworkX's spring layout: they
+# run the Numba-compiled FR kernel when Numba is installed, and otherwise
+# minimise the Fruchterman–Reingold energy with L-BFGS.
+SPRING_NODE_THRESHOLD = 100
+
+# Spring layouts of graphs with more nodes than this are computed on a
+# pyramid of coarsened graphs (see `_coarsen_and_layout`).
+MULTILEVEL_NODE_THRESHOLD = 2000
+
+# Coarsening stops once a level has at most this many nodes.
+COARSEST_NODE_COUNT = 200
+
+# FR iterations spent refining each level of the pyramid after prolongation.
+REFINE_ITERATIONS = 30
+
+# Without Numba the refinement only repels node pairs closer than this many
+# multiples of k, as in the grid variant of Fruchterman and Reingold.
+REFINE_REPULSION_RADIUS = 2.0
+
+# Layout names offered in the UI.  "random" (alias "none") skips the force
+# layout entirely, which is useful for a first look at very large graphs.
+LAYOUT_NAMES = ("spring", "kamada_kawai", "random")
+
+# Directory holding layouts persisted between sessions, one ``.npz`` per key.
+LAYOUT_CACHE_DIR = Path.home() / ".cache" / "dss" / "layouts"
+
+# Part of every layout cache key.  Bump it whenever a layout algorithm
+# changes its output so that layouts persisted by older code are ignored.
+LAYOUT_VERSION = 6
+
+
+def _fr_energy_and_grad(xy_flat: np.ndarray, A_sparse: sp.sparray, k: float, gravity: float = 1.0) -> Tuple[float, np.ndarray]:
+    """Fruchterman–Reingold energy and its gradient.
+
+    The energy integrates the classic FR forces: adjacent nodes attract
+    with ``d**2 / k`` and every pair repels with ``k**2 / d``.  A weak
+    gravity term pulls the centroid of the layout towards ``(0.5, 0.5)``.
+    It acts on the mean position only, so it fixes the translation without
+    holding disconnected components together; `_minimise_fr_energy` lays
+    those out one at a time instead.
+
+    Parameters
+    ----------
+    xy_flat: numpy.ndarray
+        Flattened ``(n, 2)`` array of node positions.
+    A_sparse: scipy.sparse array
+        Symmetric adjacency matrix with non-negative edge weights.
+    k: float
+        Optimal distance between nodes.
+    gravity: float, optional
+        Strength of the pull towards the centre.
+
+    Returns
+    -------
+    tuple
+        The energy and the flattened gradient.
+    """
+    n = A_sparse.shape[0]
+    xy = xy_flat.reshape(n, 2)
+
+    # Repulsion between all pairs: E = -k^2 * sum(log d)
+    d2 = np.maximum(pdist(xy, "sqeuclidean"), 1e-10)
+    energy = -0.5 * k * k * float(np.log(d2).sum())
+    W = squareform(k * k / d2)
+    grad = W @ xy - W.sum(axis=1)[:, None] * xy
+
+    # Attraction along edges: E = sum(w * d^3) / (3k)
+    upper = sp.triu(A_sparse, k=1).tocoo()
+    delta = xy[upper.row] - xy[upper.col]
+    dist = np.sqrt(np.maximum((delta * delta).sum(axis=1), 1e-10))
+    energy += float((upper.data * dist ** 3).sum()) / (3.0 * k)
+    force = (upper.data * dist / k)[:, None] * delta
+    for axis in range(2):
+        grad[:, axis] += np.bincount(upper.row, weights=force[:, axis], minlength=n)
+        grad[:, axis] -= np.bincount(upper.col, weights=force[:, axis], minlength=n)
+
+    # Gravity on the centroid of the layout: E = n * |mean - 0.5|^2 / 2
+    offset = xy.mean(axis=0) - 0.5
+    energy += 0.5 * gravity * n * float((offset * offset).sum())
+    grad += gravity * offset
+
+    return energy, grad.ravel()
+
+
+def _kk_energy_and_grad(xy_flat: np.ndarray, dist: np.ndarray, mean_weight: float = 1e-3) -> Tuple[float, np.ndarray]:
+    """Kamada–Kawai stress energy and its gradient.
+
+    Every pair of nodes behaves like a spring of rest length ``l_ij`` equal
+    to their graph distance and stiffness ``1 / l_ij**2``, i.e.
+    ``E = sum((d_ij - l_ij)**2 / l_ij**2)`` over all pairs, the cost
+    NetworkX minimises.  A weak parabolic term keeps the mean position near
+    the origin.
+
+    Parameters
+    ----------
+    xy_flat: numpy.ndarray
+        Flattened ``(n, 2)`` array of node positions.
+    dist: numpy.ndarray
+        Condensed (``pdist`` order) graph distances between node pairs.
+    mean_weight: float, optional
+        Strength of the pull of the mean position towards the origin.
+
+    Returns
+    -------
+    tuple
+        The energy and the flattened gradient.
+    """
+    xy = xy_flat.reshape(-1, 2)
+    d = np.maximum(pdist(xy), 1e-10)
+    offset = d / dist - 1.0
+    energy = 0.5 * float((offset * offset).sum())
+    # dE/dx_i = sum_j offset_ij / (l_ij * d_ij) * (x_i - x_j)
+    W = squareform(offset / (dist * d))
+    grad = W.sum(axis=1)[:, None] * xy - W @ xy
+
+    mean = xy.sum(axis=0)
+    energy += 0.5 * mean_weight * float((mean * mean).sum())
+    grad += mean_weight * mean
+    return energy, grad.ravel()
+
+
+def _kamada_kawai_layout(G: nx.Graph, scale: float = 1.0) -> LayoutResult:
+    """Kamada–Kawai layout from SciPy shortest paths and L-BFGS.
+
+    Follows ``nx.kamada_kawai_layout`` (circular start, unreachable pairs
+    at distance ``1e6``) but computes the all-pairs shortest paths with
+    SciPy's compiled Dijkstra instead of NetworkX's Python implementation.
+    Directed graphs are laid out as their undirected version, so the
+    result only agrees with NetworkX for undirected graphs.
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return LayoutResult([], np.empty((0, 2)))
+    A = _symmetric_adjacency(G, nodes)
+    dist = shortest_path(A, method="D", directed=False)
+    dist[~np.isfinite(dist)] = 1e6
+    dist = squareform(dist, checks=False)
+    theta = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+    x0 = np.column_stack([np.cos(theta), np.sin(theta)]).ravel()
+    res = minimize(_kk_energy_and_grad, x0, args=(dist,), method="L-BFGS-B", jac=True)
+    return LayoutResult(nodes, _rescale_coords(res.x.reshape(-1, 2), scale=scale))
+
+
+def _spring_iterations(n_nodes: int) -> int:
+    """Iteration budget for spring layouts, shrinking as the graph grows."""
+    return max(1, min(100, int(2000 / np.sqrt(n_nodes))))
+
+
+def _symmetric_adjacency(G: nx.Graph, nodes: list) -> sp.csr_array:
+    """Adjacency matrix in `nodes` order with absolute, symmetrised weights.
+
+    An edge present in one direction only keeps its full weight; for
+    reciprocal edges the larger weight is used.
+    """
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight="weight", dtype=float, format="csr")
+    A = abs(A)
+    return A.maximum(A.T).tocsr()
+
+
+def _networkx_layout(layout: Callable[..., Dict[int, np.ndarray]], G: nx.Graph, **kwargs: Any) -> LayoutResult:
+    """Run a NetworkX layout function on `G` relabelled to ``0..n-1``.
+
+    The labels are mapped to integers once so that NetworkX never hashes
+    the original (possibly string) labels, and the result is read back by
+    row index into a `LayoutResult` in the original node order.
+    """
+    nodes = list(G.nodes())
+    pos = layout(nx.convert_node_labels_to_integers(G), **kwargs)
+    coords = np.asarray([pos[i] for i in range(len(nodes))], dtype=np.float64).reshape(-1, 2)
+    return LayoutResult(nodes, coords)
+
+
+def _spring_layout_numba(G: nx.Graph, k: float, seed: int, iterations: int = 100) -> LayoutResult:
+    """Spring layout computed with the Numba-compiled FR kernel."""
+    nodes = list(G.nodes())
+    upper = sp.triu(_symmetric_adjacency(G, nodes), k=1).tocoo()
+    coords = fr_layout(len(nodes), upper.row, upper.col, upper.data, k, iterations, seed)
+    return LayoutResult(nodes, _rescale_coords(coords, scale=1.0))
+
+
+def _pack_components(parts: list, gap: float) -> list:
+    """Translate component layouts into non-overlapping rows.
+
+    Bounding boxes, padded by `gap`, are placed tallest first on shelves of
+    roughly square total width.  Returns the translated layouts in the
+    order of `parts`.
+    """
+    mins = [xy.min(axis=0) for xy in parts]
+    boxes = [xy.max(axis=0) - lo + gap for xy, lo in zip(parts, mins)]
+    row_width = max(np.sqrt(sum(w * h for w, h in boxes)), max(w for w, _ in boxes))
+    packed = [None] * len(parts)
+    x = y = row_height = 0.0
+    for i in sorted(range(len(parts)), key=lambda i: -boxes[i][1]):
+        w, h = boxes[i]
+        if x > 0.0 and x + w > row_width:
+            x, y, row_height = 0.0, y + row_height, 0.0
+        packed[i] = parts[i] - mins[i] + (x, y)
+        x += w
+        row_height = max(row_height, h)
+    return packed
+
+
+def _minimise_fr_energy(A: sp.csr_array, k: float, xy: np.ndarray, iterations: int) -> np.ndarray:
+    """Improve the ``(n, 2)`` positions `xy` by L-BFGS on the FR energy.
+
+    Each connected component is minimised on its own, since nothing binds
+    separate components together, and the results are packed side by side
+    by `_pack_components`.
+    """
+    n_components, labels = connected_components(A, directed=False)
+    order = np.argsort(labels, kind="stable")
+    members = np.split(order, np.cumsum(np.bincount(labels, minlength=n_components))[:-1])
+    parts = []
+    for idx in members:
+        if len(idx) == 1:
+            parts.append(xy[idx])
+            continue
+        res = minimize(
+            _fr_energy_and_grad,
+            xy[idx].ravel(),
+            args=(A if n_components == 1 else A[idx][:, idx], k),
+            method="L-BFGS-B",
+            jac=True,
+            options={"maxiter": iterations, "gtol": 1e-4},
+        )
+        parts.append(res.x.reshape(-1, 2))
+    if n_components == 1:
+        return parts[0]
+    out = np.empty_like(xy, dtype=np.float64)
+    for idx, part in zip(members, _pack_components(parts, gap=k)):
+        out[idx] = part
+    return out
+
+
+def _spring_layout_lbfgs(G: nx.Graph, k: float, seed: int, iterations: int = 100) -> LayoutResult:
+    """Spring layout obtained by L-BFGS minimisation of the FR energy."""
+    nodes = list(G.nodes())
+    A = _symmetric_adjacency(G, nodes)
+    init = nx.random_layout(G, seed=seed)
+    x0 = np.asarray([init[node] for node in nodes], dtype=float)
+    coords = _minimise_fr_energy(A, k, x0, iterations)
+    return LayoutResult(nodes, _rescale_coords(coords, scale=1.0))
+
+
+def _heavy_edge_matching(A: sp.csr_array, rng: np.random.Generator) -> Tuple[np.ndarray, int]:
+    """Match every node with its heaviest unmatched neighbour.
+
+    Degree-1 nodes are first merged into their neighbour, so a hub and all
+    its leaves become one super-node; matching alone would pair a hub with
+    a single leaf and barely shrink hub-and-spoke graphs.  The remaining
+    nodes are visited in random order; a node whose neighbours are all
+    matched already stays on its own.
+
+    Returns
+    -------
+    tuple
+        The super-node index of every node and the number of super-nodes.
+    """
+    n = A.shape[0]
+    degree = np.diff(A.indptr)
+    leaves = np.flatnonzero(degree == 1)
+    anchors = A.indices[A.indptr[leaves]]
+    # Pairs of degree-1 nodes (isolated edges) are left to the matching.
+    attached = degree[anchors] > 1
+    leaves, anchors = leaves[attached], anchors[attached]
+    hubs, hub_labels = np.unique(anchors, return_inverse=True)
+    initial = np.full(n, -1, dtype=np.int64)
+    initial[hubs] = np.arange(len(hubs))
+    initial[leaves] = hub_labels
+
+    indptr = A.indptr.tolist()
+    indices = A.indices.tolist()
+    weights = A.data.tolist()
+    labels = initial.tolist()
+    n_coarse = len(hubs)
+    for u in rng.permutation(n).tolist():
+        if labels[u] >= 0:
+            continue
+        best, best_w = -1, -1.0
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            if v != u and labels[v] < 0 and weights[j] > best_w:
+                best, best_w = v, weights[j]
+        labels[u] = n_coarse
+        if best >= 0:
+            labels[best] = n_coarse
+        n_coarse += 1
+    return np.asarray(labels, dtype=np.int64), n_coarse
+
+
+def _coarsen(A: sp.csr_array, rng: np.random.Generator) -> Tuple[sp.csr_array, np.ndarray]:
+    """Contract a heavy-edge matching of `A`, summing merged edge weights."""
+    labels, n_coarse = _heavy_edge_matching(A, rng)
+    n = A.shape[0]
+    P = sp.csr_array((np.ones(n), (labels, np.arange(n))), shape=(n_coarse, n))
+    coarse = (P @ A @ P.T).tocsr()
+    coarse.setdiag(0)
+    coarse.eliminate_zeros()
+    return coarse, labels
+
+
+def _refine_fr_local(upper: sp.coo_array, k: float, xy: np.ndarray, iterations: int) -> np.ndarray:
+    """FR iterations whose repulsion is limited to nearby node pairs.
+
+    NumPy counterpart of `fr_layout` for refinement without Numba: the
+    pairs within ``REFINE_REPULSION_RADIUS * k`` are found with a k-d tree,
+    so every step costs O(n log n) time and memory instead of O(n**2).
+    """
+    xy = np.array(xy, dtype=np.float64)
+    n = xy.shape[0]
+    for i in range(iterations):
+        t = k * (1.0 - i / iterations)
+        pairs = cKDTree(xy).query_pairs(REFINE_REPULSION_RADIUS * k, output_type="ndarray")
+        src = np.concatenate([pairs[:, 0], upper.row])
+        dst = np.concatenate([pairs[:, 1], upper.col])
+        delta = xy[src] - xy[dst]
+        d2 = np.maximum((delta * delta).sum(axis=1), 1e-4)
+        # Repulsion k^2 / d for the close pairs, attraction w * d^2 / k along edges
+        f = np.concatenate([k * k / d2[:len(pairs)], -upper.data * np.sqrt(d2[len(pairs):]) / k])
+        force = f[:, None] * delta
+        disp = np.empty_like(xy)
+        for axis in range(2):
+            disp[:, axis] = np.bincount(src, weights=force[:, axis], minlength=n)
+            disp[:, axis] -= np.bincount(dst, weights=force[:, axis], minlength=n)
+        length = np.maximum(np.sqrt((disp * disp).sum(axis=1)), 0.01)
+        xy += disp * (t / length)[:, None]
+    return xy
+
+
+def _refine_fr(A: sp.csr_array, k: float, xy: np.ndarray, iterations: int) -> np.ndarray:
+    """Run a short, cool FR pass starting from the positions `xy`."""
+    upper = sp.triu(A, k=1).tocoo()
+    if not NUMBA_AVAILABLE:
+        return _refine_fr_local(upper, k, xy, iterations)
+    return fr_layout(A.shape[0], upper.row, upper.col, upper.data, k, iterations, seed=0, pos=xy, t0=k)
+
+
+def _coarsen_and_layout(G: nx.Graph, spacing: float, seed: int) -> LayoutResult:
+    """Multilevel spring layout.
+
+    The graph is coarsened by repeated heavy-edge matching until at most
+    `COARSEST_NODE_COUNT` nodes remain (or matching stops shrinking it).
+    The coarsest graph is laid out by L-BFGS on the FR energy, or by
+    `_refine_fr` if coarsening stopped above `COARSEST_NODE_COUNT`.  Each
+    finer level then starts its nodes at their super-node's position, plus
+    a jitter that grows with the super-node's size, and is refined with
+    `REFINE_ITERATIONS` FR iterations.
+    """
+    nodes = list(G.nodes())
+    rng = np.random.default_rng(seed)
+    adjacencies = [_symmetric_adjacency(G, nodes)]
+    labels = []
+    while adjacencies[-1].shape[0] > COARSEST_NODE_COUNT:
+        coarse, level_labels = _coarsen(adjacencies[-1], rng)
+        if coarse.shape[0] > 0.9 * adjacencies[-1].shape[0]:
+            # Some graphs barely shrink (e.g. many nodes sharing the same
+            # two neighbours); stop instead of looping.
+            break
+        adjacencies.append(coarse)
+        labels.append(level_labels)
+
+    n_coarse = adjacencies[-1].shape[0]
+    k = spacing / np.sqrt(n_coarse)
+    if n_coarse <= COARSEST_NODE_COUNT:
+        xy = _minimise_fr_energy(adjacencies[-1], k, rng.random((n_coarse, 2)), 100)
+    else:
+        # Coarsening stalled early; the dense minimiser would need O(n^2)
+        # memory, so lay out this level with the sparse FR iterations.
+        xy = _refine_fr(adjacencies[-1], k, rng.random((n_coarse, 2)), 100)
+    for A, level_labels in zip(reversed(adjacencies[:-1]), reversed(labels)):
+        k = spacing / np.sqrt(A.shape[0])
+        # Children of a merged hub are spread over an area that grows with
+        # their number, so the local repulsion does not see them all at once.
+        sizes = np.bincount(level_labels)[level_labels]
+        spread = k * np.where(sizes > 2, 0.5 * np.sqrt(sizes), 0.1)
+        xy = xy[level_labels] + rng.normal(size=(A.shape[0], 2)) * spread[:, None]
+        xy = _refine_fr(A, k, xy, REFINE_ITERATIONS)
+    return LayoutResult(nodes, _rescale_coords(xy, scale=1.0))
+
+
+def _rescale_coords(coords: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Centre ``(n, 2)`` coordinates in place and fit them into ``[-scale, scale]``.
+
+    Both axes are multiplied by the same factor, so the aspect ratio is
+    kept; this matches ``nx.rescale_layout``.  Returns `coords`.
+    """
+    if len(coords) == 0:
+        return coords
+    coords -= coords.mean(axis=0)
+    lim = float(np.abs(coords).max())
+    # Invert the extent once so the per-element pass is a multiply; a
+    # degenerate layout gets a zero factor instead of dividing by ~0.
+    coords *= scale * (1.0 / lim if lim > 1e-12 else 0.0)
+    return coords
+
+
+def _label_bytes(node: Any) -> bytes:
+    """Encode a node label with its type, so equal reprs of different types differ."""
+    return f"{type(node).__qualname__}:{node!r}".encode("utf-8")
+
+
+def _layout_cache_key(G: nx.Graph, layout_name: str, seed: int, size_threshold: int = DEFAULTS.layout_size_threshold) -> str:
+    """Hash the graph structure and layout parameters into a cache key.
+
+    The node order is hashed as is because it determines the initial
+    positions; the edge list is sorted so that insertion order does not
+    matter.  Graphs whose labels are all Python ints are hashed as raw
+    ``int64`` bytes, any other labels through their type name and
+    ``repr``, so that e.g. ``0``, ``"0"`` and ``0.0`` never share a key.
+    The key also covers `LAYOUT_VERSION` and whether the Numba kernels
+    are used, since both change the computed layout.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    params = (
+        f"{LAYOUT_VERSION}|{layout_name}|{seed}|{DEFAULTS.layout_spacing}|{size_threshold}"
+        f"|{G.is_directed()}|{NUMBA_AVAILABLE}"
+    )
+    h.update(params.encode("utf-8"))
+    edges = list(G.edges(data="weight", default=1.0))
+    weights = np.asarray([w for _, _, w in edges], dtype=np.float64)
+    labels = list(G.nodes())
+    if all(type(n) is int and -(2 ** 63) <= n < 2 ** 63 for n in labels):
+        h.update(b"int64")
+        nodes = np.asarray(labels, dtype=np.int64)
+        uv = np.asarray([(u, v) for u, v, _ in edges], dtype=np.int64).reshape(-1, 2)
+    else:
+        h.update(b"repr")
+        nodes = np.asarray([_label_bytes(n) for n in labels])
+        uv = np.asarray([(_label_bytes(u), _label_bytes(v)) for u, v, _ in edges]).reshape(-1, 2)
+    if not G.is_directed():
+        uv = np.sort(uv, axis=1)
+    order = np.lexsort((uv[:, 1], uv[:, 0])) if len(uv) else np.empty(0, dtype=np.intp)
+    h.update(nodes.tobytes())
+    h.update(uv[order].tobytes())
+    h.update(weights[order].tobytes())
+    return h.hexdigest()
+
+
+def _load_cached_layout(path: Path) -> Optional[LayoutResult]:
+    """Read a persisted layout, returning None if it is missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            nodes = data["nodes"]
+            coords = data["coords"]
+        if nodes.ndim != 1 or coords.shape != (len(nodes), 2):
+            raise ValueError(f"nodes {nodes.shape} do not match coords {coords.shape}")
+        return LayoutResult(nodes.tolist(), coords)
+    except Exception as e:
+        # Any undecodable file, e.g. one written by an older version, is a miss.
+        logger.warning(f"Ignoring unreadable layout cache {path}: {e}")
+        return None
+
+
+def _save_cached_layout(path: Path, pos: LayoutResult) -> None:
+    """Persist a layout as parallel ``nodes`` and ``coords`` arrays.
+
+    Layouts are only written when the node labels come back unchanged from
+    a NumPy array, i.e. all labels share one scalar type.  Tuple labels
+    (stored as a 2-D array), mixed types (coerced to strings) and custom
+    objects are not persisted, and a stale file at `path` is removed.
+    """
+    nodes = np.asarray(pos.nodes) if pos.nodes else np.empty(0, dtype=np.int64)
+    restored = nodes.tolist() if nodes.ndim == 1 and nodes.dtype != object else None
+    round_trips = restored == pos.nodes and list(map(type, restored)) == list(map(type, pos.nodes))
+    try:
+        if not round_trips:
+            path.unlink(missing_ok=True)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".npz", delete=False) as f:
+            np.savez_compressed(f, nodes=nodes, coords=pos.coords)
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.warning(f"Could not write layout cache {path}: {e}")
 
 
 @cache_data
-def compute_layout(G: nx.Graph, layout_name: str = DEFAULTS.layout, seed: int = DEFAULTS.seed) -> Dict[Any, np.ndarray]:
+def compute_layout(
+    G: nx.Graph,
+    layout_name: str = DEFAULTS.layout,
+    seed: int = DEFAULTS.seed,
+    size_threshold: Optional[int] = None,
+) -> LayoutResult:
     """Compute a layout for visualising the graph.
 
+    Layouts are persisted under `LAYOUT_CACHE_DIR`, keyed by the graph
+    structure and the layout parameters, so that a fresh session can reuse
+    a layout computed earlier instead of recomputing it.
+
     Parameters
     ----------
     G: networkx.Graph
         The graph to layout.
     layout_name: str, optional
-        The name of the layout algorithm.  Currently only "spring" is
-        supported.  Additional layouts could be added in the future.
+        The name of the layout algorithm: "spring", "kamada_kawai" or
+        "random" (also "none"), which places nodes uniformly at random and
+        is neither cached nor refined.  Unknown names fall back to the
+        spring layout.
     seed: int, optional
         Seed for random layouts, ensuring reproducibility.
+    size_threshold: int, optional
+        Node count above which Kamada–Kawai is replaced by the spring
+        layout.  Defaults to `DEFAULTS.layout_size_threshold`.
 
     Returns
     -------
-    dict
-        A mapping of node to 2‑D coordinates.
+    LayoutResult
+        The node positions; usable as a ``{node: coords}`` mapping.
     """
+    if layout_name in ("none", "random"):
+        # Drawing the positions directly in [-spacing, spacing] avoids a
+        # separate rescale pass.
+        spacing = DEFAULTS.layout_spacing
+        coords = np.random.default_rng(seed).uniform(-spacing, spacing, (G.number_of_nodes(), 2))
+        return LayoutResult(list(G.nodes()), coords)
+    if size_threshold is None:
+        size_threshold = DEFAULTS.layout_size_threshold
+    path = LAYOUT_CACHE_DIR / f"{_layout_cache_key(G, layout_name, seed, size_threshold)}.npz"
+    pos = _load_cached_layout(path)
+    if pos is not None and pos.nodes != list(G.nodes()):
+        # A key collision or a stale file: the layout belongs to other nodes.
+        logger.warning(f"Ignoring layout cache {path}: node labels do not match the graph")
+        pos = None
+    if pos is None:
+        pos = _compute_layout(G, layout_name, seed, size_threshold)
+        _save_cached_layout(path, pos)
+    return pos
+
+
+def _compute_layout(G: nx.Graph, layout_name: str, seed: int, size_threshold: int) -> LayoutResult:
+    """Run the layout algorithm selected by `compute_layout`."""
     spacing = DEFAULTS.layout_spacing
-    if layout_name == "spring":
-        # return nx.spring_layout(G, seed=seed)
-        n_nodes = max(G.number_of_nodes(), 1)
-        base_k = 1 / np.sqrt(n_nodes)
-        return nx.spring_layout(G, seed=seed, k=base_k * spacing)
-    elif layout_name == "kamada_kawai":
+    n_nodes = max(G.number_of_nodes(), 1)
+    base_k = 1 / np.sqrt(n_nodes)
+    if layout_name == "kamada_kawai" and n_nodes <= size_threshold:
         # return nx.kamada_kawai_layout(G)
-        pos = nx.kamada_kawai_layout(G)
-    else:
-        # Fallback to spring layout
-        # return nx.spring_layout(G, seed=seed)
-        n_nodes = max(G.number_of_nodes(), 1)
-        base_k = 1 / np.sqrt(n_nodes)
-        return nx.spring_layout(G, seed=seed, k=base_k * spacing)
-
-    if spacing != 1.0:
-        pos = {node: coords * spacing for node, coords in pos.items()}
-    return pos
+        # The spacing is applied by the final rescale, so the coordinates
+        # are normalised only once.
+        return _kamada_kawai_layout(G, scale=spacing)
+
+    # "spring", and the fallback for unknown layout names.  Kamada–Kawai
+    # above the size threshold lands here too: its dense n x n distance
+    # matrices are far too slow there.
+    # return nx.spring_layout(G, seed=seed)
+    if n_nodes > MULTILEVEL_NODE_THRESHOLD:
+        return _coarsen_and_layout(G, spacing=spacing, seed=seed)
+    if n_nodes > SPRING_NODE_THRESHOLD:
+        spring = _spring_layout_numba if NUMBA_AVAILABLE else _spring_layout_lbfgs
+        return spring(G, k=base_k * spacing, seed=seed, iterations=_spring_iterations(n_nodes))
+    return _networkx_layout(nx.spring_layout, G, seed=seed, k=base_k * spacing)
 
 
 if __name__ == "__main__":
@@ -53,5 +583,3 @@ if __name__ == "__main__":
     pos = compute_layout(G)
     print(pos)
     print(pos)
-
-
@@ -136,10 +136,13 @@ from dss.graph.build_graph import build_graph
 from dss.graph.stats import basic_statistics
 from dss.utils.validation import validate_graph
 from dss.utils.plotting import plot_network
-from dss.graph.layouts import compute_layout
+from dss.graph.layouts import LAYOUT_NAMES, compute_layout
 from dss.ui.components import display_network
 
 
+_LAYOUT_LABELS = {"spring": "Spring", "kamada_kawai": "Kamada–Kawai", "random": "Random (fastest)"}
+
+
 def _uploaded_file_id(f) -> str:
     # Use name + size + content hash to uniquely identify uploads
     data = f.getvalue()
@@ -147,6 +150,12 @@ def _uploaded_file_id(f) -> str:
     return f"{f.name}__{f.size}__{h}"
 
 
+def _store_layout_choice() -> None:
+    # Widget keys are dropped on runs where the widget is not drawn, so the
+    # choice is copied to "layout_name", which the other pages read.
+    set_state("layout_name", st.session_state["layout_select"])
+
+
 def page() -> None:
     st.set_page_config(page_title="Upload & Overview", layout="wide")
     st.title("Upload & Overview")
@@ -253,6 +262,16 @@ def page() -> None:
                 )
             # Plot the graph
             st.subheader("Network Graph")
+            layout_name = get_state("layout_name")
+            st.selectbox(
+                "Layout",
+                LAYOUT_NAMES,
+                index=LAYOUT_NAMES.index(layout_name) if layout_name in LAYOUT_NAMES else 0,
+                key="layout_select",
+                on_change=_store_layout_choice,
+                format_func=_LAYOUT_LABELS.get,
+                help="Placement of the nodes in all network plots. A random layout is instant and useful for a first look at very large networks.",
+            )
 
             col_left, col_right = st.columns([3, 2], gap="large")
             with col_left:
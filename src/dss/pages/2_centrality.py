@@ -6,13 +6,233 @@ metrics via a weighted sum or Borda count.  Users can download the
 centrality table as CSV.
 """
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import streamlit as st
 import pandas as pd
-from dss.ui.state import init_state, get_state, set_state
-from dss.analytics.centrality import compute_centrality_result, combine_centralities, borda_count
+from dss.ui.state import init_state, get_state, set_state, get_memoized
+from dss.analytics.centrality import CENTRALITY_MEASURES, compute_centrality, combine_centralities, borda_count
 from dss.ui.components import display_network
 
 
+# Measures that can take many seconds on large graphs.  They are computed
+# on a worker thread so the page renders with the fast measures meanwhile.
+_BACKGROUND_MEASURES = ("katz", "betweenness", "closeness")
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="centrality")
+
+# Seconds between reruns of the table fragment while background measures
+# are still running.
+_POLL_INTERVAL = 0.5
+
+
+# Static text of the "Quick User Guide" expander, one markdown block per
+# column so each column is a single element.
+_GUIDE_METRICS = """
+**Degree**  
+How many direct connections does a node have?  
+High score = very connected or popular.  
+When useful: spotting hubs that connect to many neighbors.
+
+**Eigenvector**  
+Are you connected to other important nodes?  
+High score = influence through influential connections.  
+When useful: finding nodes that sit inside powerful neighborhoods.
+
+**Katz**  
+How far does your influence reach, directly and indirectly?  
+High score = strong reach through the network.  
+When useful: capturing indirect influence beyond direct neighbors.
+
+**Betweenness**  
+How often do others need you to connect?  
+High score = you act as a bridge between groups.  
+When useful: identifying brokers and critical connectors.  
+On large networks it is estimated from a random sample of nodes.
+
+**Closeness**  
+How quickly can you reach everyone else?  
+High score = centrally located in terms of distance.  
+When useful: finding nodes with fast access across the network.
+
+**PageRank**  
+How much important attention flows to you?  
+High score = prestige or authority in the network.  
+When useful: detecting nodes that receive endorsement from other important nodes.
+"""
+
+_GUIDE_SCORE = """
+#### How the final score is built
+
+**Weighting scheme**  
+Use the sliders to decide which metrics matter most.  
+Higher weight means more influence on the final score.
+
+---
+
+**Aggregation method**
+
+**Weighted sum**  
+Combines all metrics using your chosen weights.
+
+**Borda count**  
+Ranks nodes per metric and combines the rankings.  
+Useful if you care about rank agreement rather than raw score magnitude.
+
+---
+"""
+
+
+def _centrality_table(G, nodes, needed):
+    """Return the centrality table, computing only the `needed` columns.
+
+    Each column is computed at most once per graph and kept in session
+    state.  Slow measures are submitted to a background thread and picked
+    up on a later rerun.  Columns that have not been needed yet, or are
+    still being computed, are left empty (NaN).
+
+    Returns
+    -------
+    tuple
+        The table and the list of needed columns that are still pending.
+    """
+    columns = get_state("centrality_columns")
+    if columns is None:
+        columns = {}
+        set_state("centrality_columns", columns)
+    futures = get_state("centrality_futures")
+    if futures is None:
+        futures = {}
+        set_state("centrality_futures", futures)
+    pending = []
+    for name in needed:
+        if name in columns:
+            continue
+        if name not in _BACKGROUND_MEASURES:
+            columns[name] = compute_centrality(G, name)
+            continue
+        if name not in futures:
+            futures[name] = _EXECUTOR.submit(compute_centrality, G, name)
+        if futures[name].done():
+            columns[name] = futures.pop(name).result()
+        else:
+            pending.append(name)
+    table = pd.DataFrame(columns, index=nodes).reindex(columns=list(CENTRALITY_MEASURES))
+    return table, pending
+
+
+def _signature(*objs) -> str:
+    """Cheap content hash of pandas objects, used to memoise derived values."""
+    h = hashlib.blake2b(digest_size=16)
+    for obj in objs:
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        if isinstance(obj, pd.DataFrame):
+            h.update("|".join(map(str, obj.columns)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _top_n_index(series: pd.Series, n: int, largest: bool = True) -> list:
+    """Index labels of the `n` largest (or smallest) values, best first.
+
+    Matches ``series.nlargest(n)`` / ``series.nsmallest(n)``: NaNs are
+    skipped and ties keep their order in `series`.  `np.partition` finds
+    the n-th best value in linear time; only the values at least that good
+    are then sorted, by value and position.
+    """
+    arr = series.to_numpy(dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(arr))
+    key = -arr[valid] if largest else arr[valid]
+    n = min(n, len(key))
+    if n <= 0:
+        return []
+    kth = np.partition(key, n - 1)[n - 1]
+    candidates = np.flatnonzero(key <= kth)
+    best = candidates[np.lexsort((candidates, key[candidates]))[:n]]
+    return series.index[valid[best]].tolist()
+
+
+def _combined_score(G, nodes, agg_method, weight_inputs):
+    """Centrality table and combined score for the sidebar settings.
+
+    Returns
+    -------
+    tuple
+        The centrality table, the combined score per node and the list of
+        measures that are still pending.
+    """
+    if agg_method == "Weighted sum":
+        # With all weights at zero every measure counts equally.
+        needed = [col for col, w in weight_inputs.items() if w > 0] or list(weight_inputs)
+        df, pending = _centrality_table(G, nodes, needed)
+        ready = [col for col in needed if col not in pending]
+        if ready:
+            combined = combine_centralities(df[ready], weights=weight_inputs)
+        else:
+            combined = pd.Series(0.0, index=df.index)
+    else:
+        needed = [col for col, enabled in weight_inputs.items() if enabled]
+        df, pending = _centrality_table(G, nodes, needed)
+        combined = borda_count(df, {col: on and col not in pending for col, on in weight_inputs.items()})
+    combined.index.name = "Node"
+    return df, combined, pending
+
+
+def _poll_table_view(G, nodes, agg_method, weight_inputs):
+    """Fragment body run every `_POLL_INTERVAL` seconds while measures are pending.
+
+    Recomputes the combined score and shows the table; once the last
+    pending measure has finished the whole page reruns instead, so that
+    the network picks up the final scores.
+    """
+    df, combined, pending = _combined_score(G, nodes, agg_method, weight_inputs)
+    if not pending:
+        st.rerun()
+    _table_view(df, combined, pending)
+
+
+def _table_view(df, combined, pending):
+    """Show the ranked centrality table and its CSV download."""
+    if pending:
+        st.info(
+            f"Still computing: {', '.join(pending)}.  These columns are empty for now and "
+            "the combined score updates automatically when they finish."
+        )
+    # The ranked table and the CSV are only rebuilt when the table or
+    # the scores change, not on every rerun.
+    table_signature = _signature(df, combined)
+    ranked = get_memoized(
+        "centrality_ranked",
+        table_signature,
+        lambda: df.assign(combined=combined).sort_values("combined", ascending=False, kind="stable"),
+    )
+    # Display centrality table; measures not computed yet are left empty
+    st.dataframe(
+        ranked,
+    )
+
+    # Download as CSV
+    csv_data = get_memoized(
+        "centrality_csv",
+        table_signature,
+        lambda: df.assign(combined=combined).to_csv().encode("utf-8"),
+    )
+    st.download_button(
+        "Download centrality data as CSV",
+        csv_data,
+        file_name="centrality.csv",
+        mime="text/csv",
+        help="""
+Download the current centrality table as a CSV file.
+
+The exported file includes:
+- All centrality metric columns
+- The current 'combined' score based on your sidebar settings
+
+Use this if you want to analyze the results outside the dashboard.
+""",
+    )
+
+
 def page() -> None:
     st.set_page_config(page_title="Centrality Analysis", layout="wide")
 
@@ -24,82 +244,19 @@ def page() -> None:
         return
 
     with st.expander("Quick User Guide", expanded=False):
-        st.markdown(
-            """
-            **Centrality metrics (what do they mean?)**
-            """,
-        )
+        st.markdown("**Centrality metrics (what do they mean?)**")
 
         col_left, col_right = st.columns([3, 2], gap="large")
-
         with col_left:
-            st.markdown(
-                """
-                **Degree**  
-                How many direct connections does a node have?  
-                High score = very connected or popular.  
-                When useful: spotting hubs that connect to many neighbors.
-                
-                **Eigenvector**  
-                Are you connected to other important nodes?  
-                High score = influence through influential connections.  
-                When useful: finding nodes that sit inside powerful neighborhoods.
-                
-                **Katz**  
-                How far does your influence reach, directly and indirectly?  
-                High score = strong reach through the network.  
-                When useful: capturing indirect influence beyond direct neighbors.
-                
-                **Betweenness**  
-                How often do others need you to connect?  
-                High score = you act as a bridge between groups.  
-                When useful: identifying brokers and critical connectors.
-                
-                **Closeness**  
-                How quickly can you reach everyone else?  
-                High score = centrally located in terms of distance.  
-                When useful: finding nodes with fast access across the network.
-                
-                **PageRank**  
-                How much important attention flows to you?  
-                High score = prestige or authority in the network.  
-                When useful: detecting nodes that receive endorsement from other important nodes.
-                """
-            )
-
+            st.markdown(_GUIDE_METRICS)
         with col_right:
-            st.markdown("#### How the final score is built")
-            st.markdown(
-                """
-                    **Weighting scheme**  
-                    Use the sliders to decide which metrics matter most.  
-                    Higher weight means more influence on the final score.
-
-                    ---
-                    
-                    **Aggregation method**
-                    
-                    **Weighted sum**  
-                    Combines all metrics using your chosen weights.
-                    
-                    **Borda count**  
-                    Ranks nodes per metric and combines the rankings.  
-                    Useful if you care about rank agreement rather than raw score magnitude.
-
-                    ---
-                    """
-            )
+            st.markdown(_GUIDE_SCORE)
 
-    # Compute or retrieve centrality result
-    if get_state("centrality_result") is None:
-        result = compute_centrality_result(G)
-        set_state("centrality_result", result)
-    else:
-        result = get_state("centrality_result")
-
-    df = result.table
-    combined_scores = result.combined_scores
-    ranks = result.ranks
+    # Centralities are computed lazily below, once the sidebar shows which
+    # measures actually contribute to the combined score.
+    measure_names = list(CENTRALITY_MEASURES)
+    # Node order is used by several widgets below; build the list only once.
+    nodes_list = list(G.nodes())
 
     col_left, col_right = st.columns([2, 2], gap="small")
     with col_left:
@@ -139,7 +296,7 @@ Borda count:
         # Reset Borda toggles every time we switch into Borda mode
         prev_method = st.session_state.get("centrality_prev_agg_method", None)
         if agg_method == "Borda count" and prev_method != "Borda count":
-            for col in df.columns:
+            for col in measure_names:
                 st.session_state[f"borda_use_{col}"] = True
 
         st.session_state["centrality_prev_agg_method"] = agg_method
@@ -147,7 +304,7 @@ Borda count:
         if agg_method == "Weighted sum":
             # Sidebar for weighting scheme
             st.sidebar.header("Weighting scheme")
-            for col in df.columns:
+            for col in measure_names:
                 weight_inputs[col] = st.sidebar.slider(
                     f"Weight for {col}",
                     0.0,
@@ -165,11 +322,10 @@ If you want the final score to reflect mostly one metric, set that one high
 and set the others close to 0.
     """,
                 )
-            combined = combine_centralities(df, weights=weight_inputs)
         else:
             st.sidebar.header("Measure scheme")
 
-            for col in df.columns:
+            for col in measure_names:
                 key = f"borda_use_{col}"
                 weight_inputs[col] = st.sidebar.toggle(
                     label=str(col),
@@ -185,31 +341,13 @@ Off:
     """,
                 )
 
-            combined = borda_count(df, weight_inputs)
-
-        combined.index.name = "Node"
-        # Display centrality table
-        st.dataframe(
-            df.assign(combined=combined).sort_values("combined", ascending=False),
-        )
-
-        # Download as CSV
-        csv_data = df.assign(combined=combined).to_csv().encode("utf-8")
-        st.download_button(
-            "Download centrality data as CSV",
-            csv_data,
-            file_name="centrality.csv",
-            mime="text/csv",
-            help="""
-Download the current centrality table as a CSV file.
-
-The exported file includes:
-- All centrality metric columns
-- The current 'combined' score based on your sidebar settings
-
-Use this if you want to analyze the results outside the dashboard.
-""",
-        )
+        df, combined, pending = _combined_score(G, nodes_list, agg_method, weight_inputs)
+        if pending:
+            # While slow measures are running only the table is polled, so
+            # the network below is not redrawn every `_POLL_INTERVAL` seconds.
+            st.fragment(_poll_table_view, run_every=_POLL_INTERVAL)(G, nodes_list, agg_method, weight_inputs)
+        else:
+            _table_view(df, combined, pending)
 
         # Highlight controls and node selection
         st.sidebar.header("Highlight and select nodes")
@@ -249,7 +387,7 @@ This can help you spot peripheral or weakly connected nodes.
         # Node selection for detailed view
         selected_nodes = st.sidebar.multiselect(
             "Select nodes to inspect",
-            options=list(G.nodes()),
+            options=nodes_list,
             default=[],
             help="""
 Select one or more nodes to inspect in detail.
@@ -260,12 +398,11 @@ Selected nodes will:
     """,
         )
 
-        # Determine highlight nodes: top/bottom plus selected
-        highlight_nodes = []
-        if highlight_top:
-            highlight_nodes += combined.nlargest(top_n).index.tolist()
-        if highlight_bottom:
-            highlight_nodes += combined.nsmallest(top_n).index.tolist()
+        # Determine highlight nodes: top/bottom plus selected.  dict.fromkeys
+        # drops nodes that are both top and bottom while keeping the order.
+        top = _top_n_index(combined, top_n) if highlight_top else []
+        bottom = _top_n_index(combined, top_n, largest=False) if highlight_bottom else []
+        highlight_nodes = list(dict.fromkeys(top + bottom))
 
         # Always include explicitly selected nodes in highlight list
         # highlight_nodes += [n for n in selected_nodes if n not in highlight_nodes]
@@ -287,14 +424,14 @@ Use this view to quickly identify key hubs, bridges, and structurally important
         """,
             )
 
-            # Map node sizes and colours
-            size_map = combined.to_dict()
-            color_map = combined.to_dict()
+            # Node sizes and colours as one array in graph node order
+            scores = combined.reindex(nodes_list).to_numpy()
 
             display_network(
                 G,
-                node_size=size_map,
-                node_color=color_map,
+                node_size_array=scores,
+                node_color_array=scores,
+                node_order=nodes_list,
                 highlight_top=highlight_nodes,
                 highlight_selected=highlight_nodes_selected,
                 title="Centrality-scaled network",
@@ -7,8 +7,9 @@ type‑checking.  These classes should not contain heavy logic; they merely
 organise data for consumption by Streamlit pages.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 import pandas as pd
 import numpy as np
 
@@ -18,6 +19,38 @@ import numpy as np
 Node = Any
 
 
+@dataclass(eq=False)
+class LayoutResult(Mapping):
+    """Node positions stored as a node list and one ``(n, 2)`` array.
+
+    Behaves like the ``{node: coords}`` dict NetworkX uses for layouts
+    (``pos[node]``, ``items()``, ``in``), so it can be passed to the drawing
+    functions as is, while vectorised code can work on `coords` directly.
+    """
+
+    nodes: List[Node]  # Nodes in row order of `coords`
+    coords: np.ndarray  # Node positions, one row per node
+    _idx: Dict[Node, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._idx = {node: i for i, node in enumerate(self.nodes)}
+
+    def __getitem__(self, node: Node) -> np.ndarray:
+        return self.coords[self._idx[node]]
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._idx
+
+    def items(self):
+        return zip(self.nodes, self.coords)
+
+
 @dataclass
 class CentralityResult:
     """Container for centrality metrics and combined scores."""
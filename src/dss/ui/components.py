@@ -5,14 +5,26 @@ the page code concise.  Components include network visualisation,
 tables, metrics cards and charts.
 """
 
+from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Tuple, List
+import numpy as np
 import streamlit as st
+import streamlit.components.v1 as st_components
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 from ..utils.plotting import plot_network
 from ..graph.layouts import compute_layout
+from ..config import DEFAULTS
+from .state import get_memoized, get_state
+
+
+# Custom component in ``lazy_sections/`` (plain HTML and JavaScript, no build
+# step) that inserts each section's HTML once it scrolls into view.
+_lazy_sections = st_components.declare_component(
+    "lazy_sections", path=str(Path(__file__).with_name("lazy_sections"))
+)
 
 
 # def display_network(
@@ -83,6 +95,9 @@ def display_network(
     removed_edges: Optional[Iterable[Tuple[Any, Any]]] = None,
     legend_items: Optional[List] = None,
     highlight_arrested: Optional[Iterable[Any]] = None,
+    node_size_array: Optional[np.ndarray] = None,
+    node_color_array: Optional[np.ndarray] = None,
+    node_order: Optional[List[Any]] = None,
 ) -> None:
     """Render a network graph using Streamlit.
 
@@ -115,14 +130,26 @@ def display_network(
     legend_items: list optional
     items for in the legend
     highlight_arrested : highlighted arreste members 
+    node_size_array, node_color_array: numpy.ndarray, optional
+        Node sizes / colour values aligned with `node_order`; preferred over
+        the dict arguments for large graphs.
+    node_order: list, optional
+        Node order of the arrays; defaults to the order of ``G.nodes()``.
     """
     if G is None or G.number_of_nodes() == 0:
         st.info("No graph loaded.")
         return
 
-    # Compute a deterministic layout. For interactive use the layout is typically cached
-    # across calls (so node positions remain stable), but caching may be handled elsewhere.
-    pos = compute_layout(G)
+    # Compute a deterministic layout.  The last one is kept in session state
+    # for as long as the same graph object is shown with the same layout,
+    # so reruns skip even the disk cache lookup, whose key hashes every edge.
+    # The signature holds the graph itself, compared by identity.
+    layout_name = get_state("layout_name") or DEFAULTS.layout
+    pos = get_memoized(
+        "layout",
+        (G, G.number_of_nodes(), G.number_of_edges(), layout_name),
+        lambda: compute_layout(G, layout_name=layout_name),
+    )
 
     # Delegate all drawing decisions to plot_network, including highlight styling.
     fig = plot_network(
@@ -138,6 +165,9 @@ def display_network(
         label_dict=label_dict,
         removed_edges=removed_edges,
         highlight_arrested = highlight_arrested,
+        node_size_array=node_size_array,
+        node_color_array=node_color_array,
+        node_order=node_order,
     )
     if legend_items:
         ax = fig.axes[0]
@@ -179,6 +209,24 @@ def display_histogram(data: Iterable[float], title: str, xlabel: str) -> None:
     st.pyplot(fig)
 
 
+def display_lazy_sections(sections: Dict[str, str], key: str) -> None:
+    """Display titled HTML sections, rendering each body only when visible.
+
+    Parameters
+    ----------
+    sections: dict
+        Mapping of section title to trusted, pre-rendered HTML body, in
+        display order.
+    key: str
+        Stable component key, so the component is not remounted on reruns.
+    """
+    _lazy_sections(
+        sections=[{"title": title, "body": body} for title, body in sections.items()],
+        key=key,
+        default=None,
+    )
+
+
 def display_boxplot(data: Iterable[float], title: str, ylabel: str) -> None:
     """Display a box plot for robustness scores."""
     fig, ax = plt.subplots()
@@ -58,8 +58,9 @@ accessing the session dictionary directly to avoid key errors and to
 provide consistent defaults across the application.
 """
 
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
 import streamlit as st
+from ..config import DEFAULTS
 
 
 def init_state() -> None:
@@ -69,10 +70,14 @@ def init_state() -> None:
         "adjacency": None,
         "centrality_table": None,
         "centrality_result": None,
+        "centrality_columns": {},
+        "centrality_futures": {},
         "role_result": None,
         "community_results": {},
         "kemeny_result": None,
         "arrest_result": None,
+        # Network plot layout chosen on the upload page
+        "layout_name": DEFAULTS.layout,
         # Auth
         "auth_ok": False,
         "auth_user": None,
@@ -103,6 +108,8 @@ def clear_graph_state() -> None:
         "layout",
         "centrality_table",
         "centrality_result",
+        "centrality_columns",
+        "centrality_futures",
         "role_result",
         "community_results",
         "kemeny_result",
@@ -111,7 +118,9 @@ def clear_graph_state() -> None:
         "highlight_top",
         "highlight_selected",
         "highlight_arrested",
-        "last_objective"
+        "last_objective",
+        "centrality_csv",
+        "centrality_ranked",
     ]
     clear_states(keys_to_clear)
 
@@ -126,6 +135,21 @@ def set_state(key: str, value: Any) -> None:
     st.session_state[key] = value
 
 
+def get_memoized(key: str, signature: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return the value stored under `key` if it was built for `signature`.
+
+    Otherwise call `compute()`, store its result together with the
+    signature and return it.  This keeps derived values (for example a CSV
+    export) across reruns until their inputs change.
+    """
+    entry = st.session_state.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    value = compute()
+    st.session_state[key] = (signature, value)
+    return value
+
+
 if __name__ == "__main__":
     # Demonstrate usage in a non-Streamlit context
     # (This will not actually persist between runs)
@@ -300,6 +300,24 @@ import numpy as np
 #     return fig
 
 
+def _align_to_nodes(
+    values: np.ndarray,
+    node_order: Optional[List[Any]],
+    nodes_list: List[Any],
+    default: float,
+) -> np.ndarray:
+    """Return `values` (given in `node_order`) in the order of `nodes_list`.
+
+    When the orders already agree the array is used as is; otherwise the
+    values are permuted, with `default` for nodes missing from `node_order`.
+    """
+    values = np.asarray(values, dtype=float)
+    if node_order is None or list(node_order) == nodes_list:
+        return values
+    index = {n: i for i, n in enumerate(node_order)}
+    return np.array([values[index[n]] if n in index else default for n in nodes_list], dtype=float)
+
+
 def plot_network(
     G: nx.Graph,
     pos: Dict[Any, np.ndarray],
@@ -315,6 +333,9 @@ def plot_network(
     label_dict: Optional[Dict[Any, str]] = None,
     removed_edges: Optional[Iterable[Tuple[Any, Any]]] = None,
     highlight_arrested: Optional[Iterable[Any]] = None,
+    node_size_array: Optional[np.ndarray] = None,
+    node_color_array: Optional[np.ndarray] = None,
+    node_order: Optional[List[Any]] = None,
 ) -> plt.Figure:
     """Render a network plot using a fixed layout with optional labels.
 
@@ -353,6 +374,12 @@ def plot_network(
         Edges to overlay as visually "removed" (drawn as dashed red lines).
         Useful when you want to keep the overall structure visible while
         clearly indicating which connections were removed.
+    node_size_array, node_color_array: numpy.ndarray, optional
+        Node sizes / colour values as arrays aligned with `node_order`.
+        They take precedence over the `node_size` / `node_color` dicts and
+        avoid a dictionary lookup per node.
+    node_order: list, optional
+        Node order of the arrays; defaults to the order of ``G.nodes()``.
 
     Returns
     -------
@@ -370,8 +397,11 @@ def plot_network(
     # -------------------------
     # Node sizes (scaled)
     # -------------------------
-    if node_size is not None:
-        sizes_raw = np.array([node_size.get(n, 1.0) for n in nodes_list], dtype=float)
+    if node_size_array is not None or node_size is not None:
+        if node_size_array is not None:
+            sizes_raw = _align_to_nodes(node_size_array, node_order, nodes_list, default=1.0)
+        else:
+            sizes_raw = np.array([node_size.get(n, 1.0) for n in nodes_list], dtype=float)
         if float(sizes_raw.max()) > 0:
             sizes = 300.0 * (sizes_raw / float(sizes_raw.max()))
         else:
@@ -383,8 +413,11 @@ def plot_network(
     # -------------------------
     # Node colours (numeric values mapped through a colormap)
     # -------------------------
-    if node_color is not None:
-        values = np.array([node_color.get(n, 0.0) for n in nodes_list], dtype=float)
+    if node_color_array is not None or node_color is not None:
+        if node_color_array is not None:
+            values = _align_to_nodes(node_color_array, node_order, nodes_list, default=0.0)
+        else:
+            values = np.array([node_color.get(n, 0.0) for n in nodes_list], dtype=float)
         vmin, vmax = float(values.min()), float(values.max())
         if vmin == vmax:
             # Avoid a degenerate colormap range
@@ -1,7 +1,10 @@
 """Unit tests for centrality computation shapes."""
 
+from dataclasses import replace
 import networkx as nx
-from dss.analytics.centrality import compute_centralities
+from dss.analytics import centrality
+from dss.analytics.centrality import borda_count, compute_centralities
+from dss.pages import _2_centrality
 
 
 def test_compute_centralities_shape():
@@ -11,4 +14,44 @@ def test_compute_centralities_shape():
     assert df.shape[0] == 5
     # Should have at least the expected columns
     expected_cols = {"degree", "katz", "eigenvector", "betweenness", "closeness", "pagerank"}
-    assert expected_cols.issubset(df.columns)
\ No newline at end of file
+    assert expected_cols.issubset(df.columns)
+
+
+def test_betweenness_is_exact_on_small_graphs():
+    G = nx.karate_club_graph()
+    df = compute_centralities(G, measures=["betweenness"])
+    exact = nx.betweenness_centrality(G, normalized=True)
+    assert list(df.columns) == ["betweenness"]
+    for node, value in exact.items():
+        assert abs(df.loc[node, "betweenness"] - value) < 1e-12
+
+
+def test_betweenness_samples_sources_on_large_graphs(monkeypatch):
+    monkeypatch.setattr(centrality, "DEFAULTS", replace(centrality.DEFAULTS, betweenness_samples=5))
+    calls = []
+    betweenness = nx.betweenness_centrality
+
+    def spy(G, **kwargs):
+        calls.append(kwargs)
+        return betweenness(G, **kwargs)
+
+    monkeypatch.setattr(nx, "betweenness_centrality", spy)
+    G = nx.karate_club_graph()
+    first = compute_centralities(G, measures=["betweenness"])
+    second = compute_centralities(G, measures=["betweenness"])
+    assert [c["k"] for c in calls] == [5, 5]
+    assert all(c["seed"] == centrality.DEFAULTS.seed for c in calls)
+    assert first.equals(second)
+    exact = betweenness(G, normalized=True)
+    assert any(abs(first.loc[node, "betweenness"] - value) > 1e-12 for node, value in exact.items())
+
+
+def test_top_n_index_breaks_ties_like_nlargest():
+    degree = compute_centralities(nx.path_graph(5), measures=["degree"])["degree"]
+    assert _2_centrality._top_n_index(degree, 1) == [1]
+    df = compute_centralities(nx.florentine_families_graph())
+    borda = borda_count(df, {col: True for col in df.columns})
+    for n in (1, 5, 15):
+        assert _2_centrality._top_n_index(borda, n) == borda.nlargest(n).index.tolist()
+        assert _2_centrality._top_n_index(borda, n, largest=False) == borda.nsmallest(n).index.tolist()
+    assert all(type(node) is int for node in _2_centrality._top_n_index(degree, 3))
@@ -0,0 +1,311 @@
+"""Unit tests for graph layout computation."""
+
+from dataclasses import replace
+import networkx as nx
+import numpy as np
+import pytest
+from scipy.optimize import check_grad
+from scipy.sparse.csgraph import shortest_path
+from scipy.spatial.distance import squareform
+from dss.graph import layouts
+from dss.types import LayoutResult
+from dss.graph.layouts import (
+    compute_layout,
+    _coarsen,
+    _fr_energy_and_grad,
+    _kamada_kawai_layout,
+    _kk_energy_and_grad,
+    _layout_cache_key,
+    _rescale_coords,
+    _spring_layout_lbfgs,
+)
+
+
+@pytest.fixture(autouse=True)
+def layout_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(layouts, "LAYOUT_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_fr_energy_gradient_matches_finite_differences():
+    G = nx.barbell_graph(4, 2)
+    A = nx.to_scipy_sparse_array(G, dtype=float, format="csr")
+    x0 = np.random.default_rng(0).random(2 * G.number_of_nodes())
+    err = check_grad(
+        lambda x: _fr_energy_and_grad(x, A, 0.3)[0],
+        lambda x: _fr_energy_and_grad(x, A, 0.3)[1],
+        x0,
+    )
+    assert err < 1e-4
+
+
+def test_lbfgs_layout_keeps_components_apart():
+    G = nx.disjoint_union_all([nx.cycle_graph(40), nx.path_graph(30), nx.complete_graph(20)])
+    pos = _spring_layout_lbfgs(G, k=1 / np.sqrt(G.number_of_nodes()), seed=0)
+    boxes = [(pos.coords[c].min(axis=0), pos.coords[c].max(axis=0)) for c in map(list, nx.connected_components(G))]
+    for i, (lo_a, hi_a) in enumerate(boxes):
+        for lo_b, hi_b in boxes[i + 1:]:
+            assert (hi_a < lo_b).any() or (hi_b < lo_a).any()
+
+
+def test_compute_layout_large_graph_positions():
+    G = nx.connected_watts_strogatz_graph(150, 4, 0.1, seed=1)
+    pos = compute_layout(G)
+    assert set(pos) == set(G.nodes())
+    coords = np.asarray(list(pos.values()))
+    assert coords.shape == (150, 2)
+    assert np.isfinite(coords).all()
+
+
+def test_compute_layout_reuses_disk_cache(layout_cache_dir, monkeypatch):
+    G = nx.path_graph(6)
+    first = compute_layout(G)
+    assert len(list(layout_cache_dir.glob("*.npz"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("layout should have been loaded from disk")
+
+    monkeypatch.setattr(layouts, "_compute_layout", fail)
+    second = compute_layout(G)
+    assert set(second) == set(first)
+    for node in G.nodes():
+        np.testing.assert_allclose(second[node], first[node])
+
+
+def test_compute_layout_tuple_labels_are_not_persisted(layout_cache_dir):
+    G = nx.grid_2d_graph(5, 5)
+    first = compute_layout(G)
+    second = compute_layout(G)
+    assert second.nodes == first.nodes == list(G.nodes())
+    assert not list(layout_cache_dir.glob("*.npz"))
+
+
+def test_compute_layout_mixed_labels_are_not_persisted(layout_cache_dir):
+    G = nx.path_graph([0, "a", 1, "b"])
+    assert compute_layout(G).nodes == list(G.nodes())
+    assert not list(layout_cache_dir.glob("*.npz"))
+
+
+def test_compute_layout_ignores_undecodable_cache_file(layout_cache_dir):
+    G = nx.path_graph(4)
+    path = layout_cache_dir / f"{_layout_cache_key(G, 'spring', layouts.DEFAULTS.seed, layouts.DEFAULTS.layout_size_threshold)}.npz"
+    np.savez(path, nodes=np.arange(8).reshape(4, 2), coords=np.zeros((4, 2)))
+    assert compute_layout(G).nodes == list(G.nodes())
+
+
+def test_layout_cache_key_ignores_edge_order():
+    G = nx.Graph([(0, 1), (1, 2), (2, 3)])
+    H = nx.Graph()
+    H.add_nodes_from(G.nodes())
+    H.add_edges_from([(3, 2), (1, 0), (2, 1)])
+    assert _layout_cache_key(G, "spring", 1) == _layout_cache_key(H, "spring", 1)
+    assert _layout_cache_key(G, "spring", 1) != _layout_cache_key(G, "spring", 2)
+
+
+def test_layout_cache_key_distinguishes_label_types():
+    keys = {
+        _layout_cache_key(nx.path_graph(labels), "spring", 1)
+        for labels in ([0, 1, 2], ["0", "1", "2"], [0.0, 1.0, 2.0], [0.0, 1.5, 2.0])
+    }
+    assert len(keys) == 4
+
+
+def test_compute_layout_ignores_cache_for_other_nodes(monkeypatch):
+    monkeypatch.setattr(layouts, "_layout_cache_key", lambda *args: "collision")
+    compute_layout(nx.path_graph(4))
+    H = nx.path_graph(["a", "b", "c", "d"])
+    pos = compute_layout(H)
+    assert pos.nodes == list(H.nodes())
+
+
+def test_kamada_kawai_above_threshold_skips_networkx(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("kamada_kawai_layout should not run above the threshold")
+
+    monkeypatch.setattr(nx, "kamada_kawai_layout", fail)
+    G = nx.cycle_graph(30)
+    pos = compute_layout(G, layout_name="kamada_kawai", size_threshold=20)
+    assert set(pos) == set(G.nodes())
+
+
+def test_rescale_coords_keeps_aspect_ratio():
+    xy = np.array([[0.0, 1.0], [2.0, 3.0], [1.0, 5.0]])
+    expected = nx.rescale_layout(xy.copy(), scale=2.0)
+    coords = _rescale_coords(xy, scale=2.0)
+    assert coords is xy
+    np.testing.assert_allclose(coords.mean(axis=0), [0.0, 0.0])
+    np.testing.assert_allclose(np.abs(coords).max(), 2.0)
+    np.testing.assert_allclose(coords, [[-1.0, -2.0], [1.0, 0.0], [0.0, 2.0]])
+    np.testing.assert_allclose(coords, expected)
+
+
+def test_rescale_coords_degenerate_axis_is_finite():
+    coords = _rescale_coords(np.array([[1.0, 3.0], [2.0, 3.0]]))
+    assert np.isfinite(coords).all()
+    np.testing.assert_allclose(coords, [[-1.0, 0.0], [1.0, 0.0]])
+    np.testing.assert_array_equal(_rescale_coords(np.array([[4.0, 4.0]])), [[0.0, 0.0]])
+    assert _rescale_coords(np.empty((0, 2))).shape == (0, 2)
+
+
+def test_fr_step_pulls_distant_neighbours_together():
+    from dss.graph._fr_kernel import fr_step
+
+    pos = np.array([[-1.0, 0.0], [1.0, 0.0]])
+    src = np.array([0], dtype=np.int64)
+    dst = np.array([1], dtype=np.int64)
+    fr_step(pos, src, dst, np.ones(1), 0.1, 0.05, 0.0)
+    assert np.linalg.norm(pos[0] - pos[1]) < 2.0
+
+
+def test_barnes_hut_repulsion_approximates_exact_forces():
+    from dss.graph._bh import bh_repulsion
+    from dss.graph._fr_kernel import exact_repulsion
+
+    pos = np.random.default_rng(0).uniform(-1.0, 1.0, (300, 2))
+    approx = np.zeros_like(pos)
+    exact = np.zeros_like(pos)
+    bh_repulsion(pos, 0.1, 0.9, approx)
+    exact_repulsion(pos, 0.1, exact)
+    rel_err = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(rel_err) < 0.05
+
+
+def test_kamada_kawai_applies_spacing(monkeypatch):
+    monkeypatch.setattr(layouts, "DEFAULTS", replace(layouts.DEFAULTS, layout_spacing=2.0))
+    G = nx.cycle_graph(8)
+    coords = compute_layout(G, layout_name="kamada_kawai").coords
+    np.testing.assert_allclose(np.abs(coords).max(), 2.0)
+    np.testing.assert_allclose(coords, 2.0 * _kamada_kawai_layout(G).coords, atol=1e-12)
+
+
+def test_compute_layout_returns_node_aligned_coords():
+    G = nx.path_graph(5)
+    pos = compute_layout(G)
+    assert isinstance(pos, LayoutResult)
+    assert pos.nodes == list(G.nodes())
+    assert pos.coords.shape == (5, 2)
+    for i, (node, xy) in enumerate(pos.items()):
+        np.testing.assert_array_equal(pos[node], pos.coords[i])
+        np.testing.assert_array_equal(xy, pos.coords[i])
+    assert 4 in pos and 5 not in pos
+
+
+def test_compute_layout_string_nodes_match_integer_labels():
+    G = nx.path_graph(6)
+    H = nx.relabel_nodes(G, {n: f"n{n}" for n in G.nodes()})
+    pos_int = compute_layout(G)
+    pos_str = compute_layout(H)
+    assert pos_str.nodes == [f"n{n}" for n in G.nodes()]
+    np.testing.assert_allclose(pos_str.coords, pos_int.coords)
+
+
+def test_kk_energy_gradient_matches_finite_differences():
+    G = nx.barbell_graph(4, 2)
+    dist = squareform(shortest_path(nx.to_scipy_sparse_array(G), directed=False), checks=False)
+    x0 = np.random.default_rng(0).random(2 * G.number_of_nodes())
+    err = check_grad(
+        lambda x: _kk_energy_and_grad(x, dist)[0],
+        lambda x: _kk_energy_and_grad(x, dist)[1],
+        x0,
+    )
+    assert err < 1e-4
+
+
+def test_kamada_kawai_layout_matches_networkx():
+    G = nx.connected_watts_strogatz_graph(40, 4, 0.1, seed=1)
+    expected = nx.kamada_kawai_layout(G)
+    pos = _kamada_kawai_layout(G)
+    np.testing.assert_allclose(pos.coords, [expected[n] for n in G.nodes()], atol=1e-3)
+
+
+def test_symmetric_adjacency_keeps_one_way_edge_weights():
+    G = nx.DiGraph()
+    G.add_weighted_edges_from([(0, 1, 2.0), (1, 2, 3.0), (2, 1, -1.0)])
+    A = layouts._symmetric_adjacency(G, [0, 1, 2]).toarray()
+    np.testing.assert_array_equal(A, [[0.0, 2.0, 0.0], [2.0, 0.0, 3.0], [0.0, 3.0, 0.0]])
+
+
+def test_coarsen_merges_matched_pairs():
+    G = nx.path_graph(10)
+    A = nx.to_scipy_sparse_array(G, dtype=float, format="csr")
+    coarse, labels = _coarsen(A, np.random.default_rng(0))
+    assert coarse.shape[0] < 10
+    assert np.bincount(labels).max() <= 2
+    assert coarse.sum() == pytest.approx(2 * (A.sum() / 2 - (10 - coarse.shape[0])))
+
+
+def test_coarsen_merges_leaves_into_their_hub():
+    G = nx.star_graph(50)
+    nx.add_path(G, [0, 51, 52])
+    A = nx.to_scipy_sparse_array(G, dtype=float, format="csr")
+    coarse, labels = _coarsen(A, np.random.default_rng(0))
+    assert coarse.shape[0] <= 3
+    assert (labels[1:51] == labels[0]).all()
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.disjoint_union_all([nx.star_graph(600) for _ in range(4)]),
+        nx.complete_bipartite_graph(2, 2100),
+    ],
+    ids=["stars", "bipartite"],
+)
+def test_multilevel_hub_graphs_skip_dense_minimiser(G, monkeypatch):
+    assert G.number_of_nodes() > layouts.MULTILEVEL_NODE_THRESHOLD
+    minimise = layouts._minimise_fr_energy
+    sizes = []
+
+    def spy(A, *args):
+        sizes.append(A.shape[0])
+        return minimise(A, *args)
+
+    monkeypatch.setattr(layouts, "_minimise_fr_energy", spy)
+    pos = compute_layout(G)
+    assert all(size <= layouts.COARSEST_NODE_COUNT for size in sizes)
+    assert pos.nodes == list(G.nodes())
+    assert np.isfinite(pos.coords).all()
+
+
+def test_multilevel_layout_positions(monkeypatch):
+    monkeypatch.setattr(layouts, "MULTILEVEL_NODE_THRESHOLD", 100)
+    monkeypatch.setattr(layouts, "COARSEST_NODE_COUNT", 20)
+    G = nx.connected_watts_strogatz_graph(300, 4, 0.1, seed=1)
+    pos = compute_layout(G)
+    assert pos.nodes == list(G.nodes())
+    assert pos.coords.shape == (300, 2)
+    assert np.isfinite(pos.coords).all()
+
+
+def test_multilevel_refinement_without_numba_is_sparse(monkeypatch):
+    monkeypatch.setattr(layouts, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(layouts, "MULTILEVEL_NODE_THRESHOLD", 100)
+    monkeypatch.setattr(layouts, "COARSEST_NODE_COUNT", 20)
+    minimise = layouts._minimise_fr_energy
+    sizes = []
+
+    def spy(A, *args):
+        sizes.append(A.shape[0])
+        return minimise(A, *args)
+
+    monkeypatch.setattr(layouts, "_minimise_fr_energy", spy)
+    G = nx.connected_watts_strogatz_graph(300, 4, 0.1, seed=1)
+    pos = compute_layout(G)
+    # Only the coarsest level runs the dense energy minimisation.
+    assert len(sizes) == 1 and sizes[0] <= 20
+    assert np.isfinite(pos.coords).all()
+    edges = np.asarray([(u, v) for u, v in G.edges()])
+    edge_length = np.linalg.norm(pos.coords[edges[:, 0]] - pos.coords[edges[:, 1]], axis=1).mean()
+    assert edge_length < 0.5 * np.abs(pos.coords).max()
+
+
+def test_random_layout_skips_force_layout_and_cache(layout_cache_dir, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("random layout should not run a force layout")
+
+    monkeypatch.setattr(layouts, "_compute_layout", fail)
+    G = nx.path_graph(50)
+    pos = compute_layout(G, layout_name="random")
+    assert pos.nodes == list(G.nodes())
+    assert np.abs(pos.coords).max() <= layouts.DEFAULTS.layout_spacing
+    assert not list(layout_cache_dir.glob("*.npz"))
@@ -0,0 +1,38 @@
+"""Unit tests for network plotting."""
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+from matplotlib.collections import PathCollection
+from dss.utils.plotting import plot_network
+
+
+def _node_layer(fig):
+    """Sizes and colour values of the base node layer of a plot."""
+    layer = next(c for c in fig.axes[0].collections if isinstance(c, PathCollection))
+    sizes, values = layer.get_sizes().copy(), np.asarray(layer.get_array()).copy()
+    plt.close(fig)
+    return sizes, values
+
+
+def test_plot_network_arrays_follow_node_order():
+    G = nx.path_graph(5)
+    pos = nx.circular_layout(G)
+    scores = {0: 1.0, 1: 4.0, 2: 2.0, 3: 8.0, 4: 5.0}
+    order = [3, 0, 4, 2, 1]
+    values = np.array([scores[n] for n in order])
+    expected = _node_layer(plot_network(G, pos, node_size=scores, node_color=scores))
+    got = _node_layer(plot_network(G, pos, node_size_array=values, node_color_array=values, node_order=order))
+    np.testing.assert_allclose(got[0], expected[0])
+    np.testing.assert_allclose(got[1], expected[1])
+
+
+def test_plot_network_arrays_default_missing_nodes():
+    G = nx.path_graph(4)
+    pos = nx.circular_layout(G)
+    order = [2, 0]
+    values = np.array([6.0, 3.0])
+    sizes, colours = _node_layer(plot_network(G, pos, node_size_array=values, node_color_array=values, node_order=order))
+    # Missing nodes get size 1.0 and colour 0.0 before scaling.
+    np.testing.assert_allclose(sizes, 300.0 * np.array([3.0, 1.0, 6.0, 1.0]) / 6.0)
+    np.testing.assert_allclose(colours, [3.0, 0.0, 6.0, 0.0])
@@ -0,0 +1,61 @@
+"""Unit tests for the session-state helpers and their users."""
+
+import networkx as nx
+import pandas as pd
+import pytest
+import streamlit as st
+from dss.graph.layouts import compute_layout
+from dss.pages import _2_centrality
+from dss.ui import components
+from dss.ui.state import get_memoized
+
+
+@pytest.fixture
+def session_state(monkeypatch):
+    state = {}
+    monkeypatch.setattr(st, "session_state", state)
+    return state
+
+
+def test_get_memoized_recomputes_only_for_new_signature(session_state):
+    calls = []
+
+    def compute():
+        calls.append(len(calls))
+        return len(calls)
+
+    assert get_memoized("value", "a", compute) == 1
+    assert get_memoized("value", "a", compute) == 1
+    assert calls == [0]
+    assert get_memoized("value", "b", compute) == 2
+    assert get_memoized("value", "a", compute) == 3
+    assert session_state["value"] == ("a", 3)
+
+
+def test_signature_tracks_values_index_and_columns():
+    df = pd.DataFrame({"degree": [1.0, 2.0], "pagerank": [0.5, 0.5]}, index=["a", "b"])
+    combined = pd.Series([1.0, 2.0], index=df.index)
+    signature = _2_centrality._signature(df, combined)
+    assert _2_centrality._signature(df.copy(), combined.copy()) == signature
+    assert _2_centrality._signature(df, combined * 2) != signature
+    assert _2_centrality._signature(df.set_axis(["b", "a"]), combined) != signature
+    assert _2_centrality._signature(df.rename(columns={"pagerank": "katz"}), combined) != signature
+
+
+def test_display_network_reuses_layout_for_same_graph(session_state, monkeypatch):
+    calls = []
+
+    def layout(G, layout_name):
+        calls.append(layout_name)
+        return compute_layout(G, layout_name="random")
+
+    monkeypatch.setattr(components, "compute_layout", layout)
+    monkeypatch.setattr(components.st, "pyplot", lambda fig: None)
+    G = nx.path_graph(5)
+    components.display_network(G)
+    components.display_network(G)
+    assert len(calls) == 1
+    components.display_network(G.copy())
+    session_state["layout_name"] = "kamada_kawai"
+    components.display_network(G)
+    assert calls == ["spring", "spring", "kamada_kawai"]
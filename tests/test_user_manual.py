@@ -0,0 +1,26 @@
+"""Unit tests for the pre-rendered user manual."""
+
+import gzip
+import importlib.util
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+def build_manual():
+    pytest.importorskip("markdown")
+    spec = importlib.util.spec_from_file_location("build_manual", ROOT / "scripts" / "build_manual.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_user_manual_html_is_up_to_date(build_manual):
+    fragment = build_manual.render_fragment(build_manual.SOURCE.read_text(encoding="utf-8"))
+    assert build_manual.FRAGMENT.read_text(encoding="utf-8") == fragment
+    document = build_manual.render_document(fragment)
+    assert build_manual.DOCUMENT.read_text(encoding="utf-8") == document
+    assert gzip.decompress(build_manual.COMPRESSED.read_bytes()).decode("utf-8") == document
+